@@ -6,21 +6,42 @@ Most of the tests are currently doctests. Have patience.
 
 import sys
 from contextlib import contextmanager
+from functools import lru_cache
+from typing import Optional
 
 import pytest
+from _pytest.doctest import DoctestItem
 import sqlalchemy as sa
 from flask import Flask, appcontext_pushed, g
 from oso import Oso
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import Session
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
 from sqlalchemy_oso import register_models
 
 from sqlalchemy_authorize import OsoPermissionsMixin, BasePermissionsMixin
+from sqlalchemy_authorize.oso import RBAC_POLAR
+
+
+class Base(DeclarativeBase):
+    pass
+
 
-Base = declarative_base()
 engine = create_engine('sqlite:///:memory:', echo=False)
-sess = Session(engine)
+SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+
+
+# pysqlite's own transaction handling breaks SAVEPOINTs (which the
+# ``session`` fixture relies on), so we emit BEGIN ourselves. See
+# "Serializable isolation / Savepoints / Transactional DDL" in
+# https://docs.sqlalchemy.org/en/20/dialects/sqlite.html
+@event.listens_for(engine, "connect")
+def do_connect(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def do_begin(conn):
+    conn.exec_driver_sql("BEGIN")
 
 
 # -- Models -------------------------------------------------------------------
@@ -29,7 +50,7 @@ sess = Session(engine)
 class BaseUser(BasePermissionsMixin, Base):
     __tablename__ = 'baseuser'
     __repr_attrs__ = ['name']
-    __permissions__ = OsoPermissionsMixin.load_permissions(
+    __permissions__ = dict(
         # Public permissions
         read=["id", "username"],
 
@@ -46,11 +67,11 @@ class BaseUser(BasePermissionsMixin, Base):
         admin="*"  # i.e., all actions on all fields
     )
 
-    id = sa.Column(sa.String(128), primary_key=True)
-    username = sa.Column(sa.String(128), nullable=False)
-    fullname = sa.Column(sa.String(128), nullable=False)
-    ssn = sa.Column(sa.String(10), nullable=True)
-    is_admin = sa.Column(sa.Boolean, default=False)
+    id: Mapped[str] = mapped_column(sa.String(128), primary_key=True)
+    username: Mapped[str] = mapped_column(sa.String(128))
+    fullname: Mapped[str] = mapped_column(sa.String(128))
+    ssn: Mapped[Optional[str]] = mapped_column(sa.String(10))
+    is_admin: Mapped[Optional[bool]] = mapped_column(sa.Boolean, default=False)
 
     def __repr__(self):
         return f"<BaseUser {self.id}>"
@@ -59,7 +80,7 @@ class BaseUser(BasePermissionsMixin, Base):
 class User(OsoPermissionsMixin, Base):
     __tablename__ = 'user'
     __repr_attrs__ = ['name']
-    __permissions__ = OsoPermissionsMixin.load_permissions(
+    __permissions__ = dict(
         # Public permissions
         read=["id", "username"],
 
@@ -76,11 +97,11 @@ class User(OsoPermissionsMixin, Base):
         admin="*"  # i.e., all actions on all fields
     )
 
-    id = sa.Column(sa.String(128), primary_key=True)
-    username = sa.Column(sa.String(128), nullable=False)
-    fullname = sa.Column(sa.String(128), nullable=False)
-    ssn = sa.Column(sa.String(10), nullable=True)
-    is_admin = sa.Column(sa.Boolean, default=False)
+    id: Mapped[str] = mapped_column(sa.String(128), primary_key=True)
+    username: Mapped[str] = mapped_column(sa.String(128))
+    fullname: Mapped[str] = mapped_column(sa.String(128))
+    ssn: Mapped[Optional[str]] = mapped_column(sa.String(10))
+    is_admin: Mapped[Optional[bool]] = mapped_column(sa.Boolean, default=False)
 
     def __repr__(self):
         return f"<User {self.id}>"
@@ -90,15 +111,28 @@ class User(OsoPermissionsMixin, Base):
 
 
 @pytest.fixture(scope="session")
-def session():
-    sess.rollback()
-
-    Base.__class__._session = None
-    Base.metadata.drop_all(engine)
+def schema():
+    """Creates the tables (once per test session)."""
     Base.metadata.create_all(engine)
 
-    Base.__class__._session = sess
-    return sess
+
+@pytest.fixture
+def session(schema):
+    """A session bound to an outer transaction that is rolled back after
+    each test (so tests don't have to reset the schema)."""
+    connection = engine.connect()
+    trans = connection.begin()
+    # Tests may ``commit``/``rollback`` themselves: these only ever
+    # release/roll back a SAVEPOINT, never ``trans``.
+    session = SessionLocal(
+        bind=connection, join_transaction_mode="create_savepoint"
+    )
+
+    yield session
+
+    session.close()
+    trans.rollback()
+    connection.close()
 
 
 @pytest.fixture(scope="session")
@@ -111,19 +145,33 @@ def app(oso):
             yield client
 
 
-@pytest.fixture(scope="session")
-def oso():
+@lru_cache(maxsize=None)
+def load_oso(policy):
+    """Builds an ``Oso`` instance (registering our models and loading
+    ``policy``) once per policy."""
     oso = Oso()
     register_models(oso, User)
 
     from sqlalchemy_authorize.oso.oso_permissions_mixin import UserMock
     oso.register_class(UserMock)
 
-    oso.load_files(["./sqlalchemy_authorize/oso/rbac.polar"])
+    oso.load_str(policy)
 
     return oso
 
 
+@pytest.fixture(scope="session")
+def oso():
+    return load_oso(RBAC_POLAR)
+
+
+@pytest.fixture
+def batch_authorized_fields(monkeypatch):
+    """Turns on :attr:`OsoPermissionsMixin.batch_authorized_fields` for
+    one test."""
+    monkeypatch.setattr(OsoPermissionsMixin, "batch_authorized_fields", True)
+
+
 @contextmanager
 def user_set(app, user):
     g.user = user
@@ -133,26 +181,39 @@ def user_set(app, user):
 # -- Doctest Namespace --------------------------------------------------------
 
 
-@pytest.fixture(scope="session", autouse=True)
-def add_app(doctest_namespace):
+@pytest.fixture(autouse=True)
+def populate_doctest_namespace(request):
+    """Fills the doctest namespace, but only for doctests (so other tests
+    don't pay for setting up the ``app`` and ``oso``)."""
+    if not isinstance(request.node, DoctestItem):
+        return
+
+    names = ("add_app", "add_BaseUser", "add_User", "add_oso", "add_user_set")
+
+    for name in names:
+        request.getfixturevalue(name)
+
+
+@pytest.fixture(scope="session")
+def add_app(doctest_namespace, app):
     doctest_namespace["app"] = app
 
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture(scope="session")
 def add_BaseUser(doctest_namespace):
     doctest_namespace["BaseUser"] = BaseUser
 
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture(scope="session")
 def add_User(doctest_namespace):
     doctest_namespace["User"] = User
 
 
-@pytest.fixture(scope="session", autouse=True)
-def add_oso(doctest_namespace):
+@pytest.fixture(scope="session")
+def add_oso(doctest_namespace, oso):
     doctest_namespace["oso"] = oso
 
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture(scope="session")
 def add_user_set(doctest_namespace):
     doctest_namespace["user_set"] = user_set
@@ -1,10 +1,19 @@
+import sys
 from enum import Enum
 
 
 class CRUD(str, Enum):
-    """Standard 'CRUD' actions."""
-    CREATE = "create"
-    READ = "read"
-    UPDATE = "update"
-    DELETE = "delete"
+    """Standard 'CRUD' actions.
 
+    The values are interned, so comparing them against other
+    (interned) action names is usually a pointer comparison.
+    """
+    CREATE = sys.intern("create")
+    READ = sys.intern("read")
+    UPDATE = sys.intern("update")
+    DELETE = sys.intern("delete")
+
+
+# Plain (interned) strings, for the hot paths that would otherwise go through
+# ``CRUD.<ACTION>.value`` on every attribute access.
+CREATE, READ, UPDATE, DELETE = (e.value for e in CRUD)
@@ -0,0 +1,4 @@
+import pkgutil
+
+#: The example polar policy (``rbac.polar``), to pass to ``oso.load_str``.
+RBAC_POLAR = pkgutil.get_data(__name__, "rbac.polar").decode("utf-8")
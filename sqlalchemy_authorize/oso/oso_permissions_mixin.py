@@ -1,10 +1,14 @@
 from dataclasses import dataclass
-from contextlib import contextmanager
+from contextlib import nullcontext
+from typing import Any, Callable, Iterable, Optional
 
-from sqlalchemy_authorize.permissions_mixin import BasePermissionsMixin
+from oso.exceptions import AuthorizationError
 
+from sqlalchemy_authorize.constants import READ
+from sqlalchemy_authorize.permissions_mixin import BasePermissionsMixin, _EMPTY
 
-class OsoPermissionsMixin(BasePermissionsMixin):
+
+class OsoPermissionsMixin(BasePermissionsMixin, mixin=True):
     """Authorize your fields using Oso_.
 
     E.g. (using the ``User`` model defined in :ref:`conftest.py`
@@ -28,23 +32,48 @@ class OsoPermissionsMixin(BasePermissionsMixin):
     >>> john_doe.username, john_doe.id
     ('doe_john', '2')
 
+    By default, the ``Oso`` instance and the current user come from
+    Flask (``current_app.oso`` and ``g.user``). Flask is only imported
+    when these defaults are first needed, so for other frameworks,
+    set :attr:`oso_resolver` and :attr:`user_resolver` instead, e.g.::
+
+        OsoPermissionsMixin.oso_resolver = lambda: my_app.state.oso
+        OsoPermissionsMixin.user_resolver = lambda: current_user.get(None)
+
     .. _Oso: <https://www.osohq.com/>
     """
+    __slots__ = ()
 
-    @staticmethod
-    def get_oso():
+    # Zero-argument callables that return the current ``Oso`` instance and
+    # the current user (or ``None`` if there isn't one). ``None`` means
+    # "use Flask" (see :func:`_use_flask_resolvers`).
+    oso_resolver: Optional[Callable[[], Any]] = None
+    user_resolver: Optional[Callable[[], Any]] = None
+
+    # Which error factory (on the ``Oso`` instance) to use per action.
+    # Anything else gets a ``forbidden_error``.
+    _ERROR_ATTR = {READ: "not_found_error"}
+
+    # Whether :meth:`authorize_fields_batch` may ask ``oso`` for all
+    # fields at once. Only turn this on if your ``allow_field`` rules can be
+    # queried with an unbound ``field`` (like the ones in ``rbac.polar``).
+    batch_authorized_fields: bool = False
+
+    @classmethod
+    def get_oso(cls):
         """Function to get the current oso instance.
 
-        By default assumes you've attached ``oso`` to the ``app``
-        during setup.
+        Uses :attr:`oso_resolver`. By default assumes you've attached
+        ``oso`` to the (Flask) ``app`` during setup.
         """
+        if cls.oso_resolver is None:
+            _use_flask_resolvers()
 
-        from flask import current_app
-        return current_app.oso
+        return cls.oso_resolver()
 
     @staticmethod
     def get_anonymous_user():
-        """Returns a mock anonymous user.
+        """Returns a (shared, immutable) mock anonymous user.
 
         You'll probably want to overload this with a method that
         creates an anonymous instance of your `User` model.
@@ -54,48 +83,247 @@ class OsoPermissionsMixin(BasePermissionsMixin):
         ``user.id``, then this may suffice.
         """
 
-        return UserMock(id="anon")
+        return _ANON_USER
 
     def get_user(self):
         """Function to get the current user (which will get passed as
         the actor to ``oso.authorize_fields`` ).
 
-        By default assumes a user in ``g.user``.
+        Uses :attr:`user_resolver`, and falls back to
+        :meth:`get_anonymous_user`. By default assumes a user in
+        ``g.user``.
         """
-        from flask import g
-        return getattr(g, "user", self.get_anonymous_user())
+        cls = type(self)
+
+        if cls.user_resolver is None:
+            _use_flask_resolvers()
+
+        user = cls.user_resolver()
+
+        if user is None:
+            return self.get_anonymous_user()
+
+        return user
+
+    def get_user_roles(self, user) -> Iterable[str]:
+        """The roles ``user`` is known to have on this resource
+        without having to consult the polar policy.
+
+        These are checked against the static ``__permissions__``
+        before falling through to ``oso``. The "public" role
+        (``has_role(_user, "public", _resource)`` in ``rbac.polar``)
+        is always checked first, so by default this is empty.
+        Override this if your actors carry (resource-independent)
+        roles with them.
+        """
+        return ()
 
     def error(self, action: str):
         """Returns an appropriate exception for the action.
 
+        The exception is looked up in :attr:`_ERROR_ATTR` (the name of
+        the error factory on the ``Oso`` instance), so subclasses can
+        extend that table instead of overriding this method.
+
+        >>> root = User(id="5", username="root", is_admin=True)
+        >>> with user_set(app, root), root.denied("update", "username"):
+        ...     root.username = "toor"
+        Traceback (most recent call last):
+        oso.exceptions.ForbiddenError: ...
+
         :returns:
 
             - :exec:`ForbiddenError` for create/update/delete, or a
             - :exec:`NotFoundError` for reads.
 
         """
-        if action == "read":
-            return self.get_oso().not_found_error()
-
-        return self.get_oso().forbidden_error
+        # ``type(self)`` so these lookups don't need authorization themselves.
+        cls = type(self)
+        return getattr(cls.get_oso(), cls._ERROR_ATTR.get(action, "forbidden_error"))()
 
     def authorize_field(self, action, key):
+        """Checks the static ``__permissions__`` first, and only
+        asks ``oso`` when these are inconclusive (e.g., for
+        relation-based roles like "self").
+
+        >>> jane_doe = User(id="4", username="jane_doe", fullname="Jane Doe")
+        >>> with user_set(app, OsoPermissionsMixin.get_anonymous_user()):
+        ...     jane_doe.username
+        'jane_doe'
+        >>> with user_set(app, OsoPermissionsMixin.get_anonymous_user()):
+        ...     jane_doe.fullname
+        Traceback (most recent call last):
+        oso.exceptions.ForbiddenError: ...
+        """
+        # Public fields don't even need the current user.
+        if (
+            self.PUBLIC_ROLE in self._wildcard_roles_for_action.get(action, _EMPTY)
+            or key in self._public_perms.get(action, _EMPTY)
+        ):
+            return
+
+        user = self.get_user()
+
+        if self._authorized_statically(user, action, key):
+            return
+
+        oso = self.get_oso()
+
         # To avoid self-referential death spiral if oso needs to read actor
         # attributes.
+        with _NULL_CTX if user is None else user.exposed():
+            oso.authorize_field(user, action, self, key)
+
+    def authorize_fields_batch(self, action, keys):
+        """Checks several keys, skipping ``oso`` for the ones the static
+        ``__permissions__`` settle.
+
+        The rest get one ``oso.authorize_field`` query each, unless
+        :attr:`batch_authorized_fields` is set, in which case they share
+        a single ``oso.authorized_fields`` query.
+
+        >>> root = User(id="6", username="root", is_admin=True)
+        >>> with user_set(app, root):
+        ...     User(id="7", username="jdoe", fullname="John Doe", check_create=True)
+        <User 7>
+        >>> _ = getfixture("batch_authorized_fields")
+        >>> with user_set(app, root):
+        ...     User(id="9", username="jdoe", fullname="John Doe", check_create=True)
+        <User 9>
+        >>> with user_set(app, OsoPermissionsMixin.get_anonymous_user()):
+        ...     User(id="10", username="jdoe", fullname="John Doe", check_create=True)
+        Traceback (most recent call last):
+        oso.exceptions.ForbiddenError: ...
+        """
+        if self.PUBLIC_ROLE in self._wildcard_roles_for_action.get(action, _EMPTY):
+            return
+
+        public = self._public_perms.get(action, _EMPTY)
+
         user = self.get_user()
+        keys = [
+            key for key in keys
+            if key not in public and not self._authorized_statically(user, action, key)
+        ]
 
-        if user is None:
-            self.get_oso().authorize_field(user, action, self, key)
-        else:
-            with user.exposed():
-                self.get_oso().authorize_field(user, action, self, key)
+        if not keys:
+            return
+
+        if len(keys) == 1 or not self.batch_authorized_fields:
+            for key in keys:
+                self.authorize_field(action, key)
+
+            return
 
+        oso = self.get_oso()
 
-@dataclass
+        with _NULL_CTX if user is None else user.exposed():
+            fields = oso.authorized_fields(user, action, self, allow_wildcard=True)
+
+        if "*" in fields:
+            return
+
+        for key in keys:
+            if key not in fields:
+                raise oso.forbidden_error()
+
+    def permitted_fields(self, action):
+        """The public fields, the fields of the roles in
+        :meth:`get_user_roles`, and the fields ``oso`` allows for the
+        current user.
+
+        Like :meth:`authorize_fields_batch`, this asks ``oso`` about each
+        of the remaining :attr:`authorizable_fields` separately, unless
+        :attr:`batch_authorized_fields` is set (then it's a single
+        ``oso.authorized_fields`` query).
+
+        >>> jane_doe = User(id="8", username="jane_doe", fullname="Jane Doe")
+        >>> with user_set(app, OsoPermissionsMixin.get_anonymous_user()):
+        ...     jane_doe.authorized_fields(READ)
+        ['id', 'username']
+        >>> with user_set(app, jane_doe):
+        ...     "fullname" in jane_doe.authorized_fields(READ)
+        True
+        """
+        fields = set(self._public_perms.get(action, _EMPTY))
+        user = self.get_user()
+
+        for role in self.get_user_roles(user):
+            fields |= self._perm_table.get((role, action), _EMPTY)
+
+        if "*" in fields:
+            return frozenset(fields)
+
+        if self.batch_authorized_fields:
+            with _NULL_CTX if user is None else user.exposed():
+                fields |= self.get_oso().authorized_fields(
+                    user, action, self, allow_wildcard=True
+                )
+
+            return frozenset(fields)
+
+        for key in type(self)._authorizable_fields_cache - fields:
+            try:
+                self.authorize_field(action, key)
+            except AuthorizationError:
+                continue
+
+            fields.add(key)
+
+        return frozenset(fields)
+
+    def _authorized_statically(self, user, action, key) -> bool:
+        """Whether the static ``__permissions__`` (for the roles in
+        :meth:`get_user_roles`) allow ``action`` on ``key``."""
+        # Static permissions only need a lookup (no polar evaluation).
+        wildcard_roles = self._wildcard_roles_for_action.get(action, _EMPTY)
+
+        for role in self.get_user_roles(user):
+            if role in wildcard_roles or key in self._perm_table.get((role, action), _EMPTY):
+                return True
+
+        return False
+
+
+def _use_flask_resolvers():
+    """Fills in any resolvers on :class:`OsoPermissionsMixin` that
+    haven't been set with Flask-based ones (``current_app.oso`` and
+    ``g.user``)."""
+    from flask import current_app, g
+
+    # ``current_app.oso`` resolves the proxy *and* looks up ``oso`` on each
+    # call. Instead, remember the ``oso`` of the last app we've seen (so this
+    # assumes ``app.oso`` doesn't get replaced while the app is running).
+    last_app, last_oso = None, None
+
+    def flask_oso_resolver():
+        nonlocal last_app, last_oso
+        app = current_app._get_current_object()
+
+        if app is not last_app:
+            last_app, last_oso = app, app.oso
+
+        return last_oso
+
+    if OsoPermissionsMixin.oso_resolver is None:
+        OsoPermissionsMixin.oso_resolver = flask_oso_resolver
+
+    if OsoPermissionsMixin.user_resolver is None:
+        OsoPermissionsMixin.user_resolver = lambda: g.get("user")
+
+
+_NULL_CTX = nullcontext()
+
+
+@dataclass(frozen=True)
 class UserMock:
+    # (``dataclass(slots=True)`` requires python 3.10.)
+    __slots__ = ("id",)
+
     id: str
 
-    @staticmethod
-    @contextmanager
-    def exposed():
-        yield
+    def exposed(self):
+        return _NULL_CTX
+
+
+_ANON_USER = UserMock(id="anon")
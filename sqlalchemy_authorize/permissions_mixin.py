@@ -1,8 +1,46 @@
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import List, Union, Optional
 
-from sqlalchemy_authorize.constants import CRUD
-from sqlalchemy_authorize.utils import classproperty, is_dunder
+from sqlalchemy_authorize.constants import CRUD, CREATE, READ, UPDATE, DELETE
+from sqlalchemy_authorize.utils import classproperty, freeze, is_dunder
+
+_EMPTY = frozenset()
+
+
+def _build_perm_table(permissions: Optional[dict], public_role: str):
+    """Flattens a ``__permissions__`` dictionary into lookup tables.
+
+    :returns: A ``{(role, action): frozenset(fields)}`` table, the
+        ``{action: frozenset(roles)}`` that may perform that action on
+        every field (i.e., have a ``"*"``), the
+        ``{action: frozenset(fields)}`` granted to ``public_role``,
+        and the set of all actions.
+    """
+    perm_table = {}
+    actions = set()
+
+    for (role, role_permissions) in (permissions or {}).items():
+        for (action, fields) in role_permissions.items():
+            perm_table[(role, action)] = frozenset(fields)
+            actions.add(action)
+
+    wildcard_roles_for_action = {
+        action: frozenset(
+            role
+            for role in (permissions or {}).keys()
+            if "*" in perm_table.get((role, action), _EMPTY)
+        )
+        for action in actions
+    }
+
+    public_perms = {
+        action: fields
+        for ((role, action), fields) in perm_table.items()
+        if role == public_role
+    }
+
+    return perm_table, wildcard_roles_for_action, public_perms, frozenset(actions)
 
 
 class BasePermissionsMixin:
@@ -11,7 +49,8 @@ class BasePermissionsMixin:
     E.g.::
 
         class BaseUser(BasePermissionsMixin, db.Model):
-            __permissions__ = BasePermissionsMixin.load_permissions(
+            # (Expanded with :meth:`load_permissions` when the class is created.)
+            __permissions__ = dict(
                 # Public permissions
                 read=["id", "username"],
 
@@ -63,9 +102,29 @@ class BasePermissionsMixin:
     True
 
     .. field-level authorization policy: <https://docs.osohq.com/guides/enforcement/field.html>`_.
+
+    .. NOTE:: The per-instance state lives in ``__slots__``. Declarative
+        models still carry a ``__dict__`` (SQLAlchemy needs it), but these
+        attributes don't end up in it.
     """
+    # (``actions`` & the lookup tables below double as class attributes,
+    # so they can't be slots.)
+    __slots__ = ("_protected", "_allowed_fields", "_forbidden_fields", "_authz_cache")
+
     __permissions__ = None
 
+    # Lookup tables derived from ``__permissions__``.
+    # See :meth:`invalidate_perm_cache`.
+    _compiled = None  # The (expanded) ``__permissions__`` these are built from.
+    _perm_table = {}
+    _wildcard_roles_for_action = {}
+    _public_perms = {}
+    _actions = _EMPTY
+    _authorizable_fields_frozen = None
+
+    # See :attr:`exempted_fields` (filled in below the class body).
+    _EXEMPTED = _EMPTY
+
     DEFAULT_ACTIONS = [e.value for e in CRUD]
     PUBLIC_ROLE = "public"  # The name of the "public" / fallback role.
 
@@ -86,16 +145,19 @@ class BasePermissionsMixin:
         # ``self.__setattr__`` requires ``_protected`` to resolve.
         # This gets around that circular dependency.
         super().__setattr__("_protected", False)
-        super().__setattr__("actions", self.__class__.actions)
+        super().__setattr__("actions", type(self)._actions)
 
         # For use with :meth:`Wrapper.allow` and :meth:`Wrapper.deny`
-        self._allowed_fields = {action: [] for action in self.actions}
-        self._forbidden_fields = {action: [] for action in self.actions}
+        # (``None`` until the first call, since most instances never need them).
+        self._allowed_fields = None
+        self._forbidden_fields = None
+
+        # Memoizes :meth:`_requires_check` (see there).
+        self._authz_cache = {}
 
         if check_create:
             with self.protected():
-                for key in kwargs.keys():
-                    self.authorize("create", key)
+                self.authorize_batch(CREATE, kwargs.keys())
 
         # This requires this mixin to be included before SQLAlchemy's declarative base.
         # TODO: Filter kwargs for those with ``create`` permissions.
@@ -103,11 +165,78 @@ class BasePermissionsMixin:
 
         self._protected = protected
 
+    def __init_subclass__(cls, mixin: bool = False, **kwargs):
+        """Expands ``__permissions__`` and builds the lookup tables.
+
+        :param mixin: Pass ``mixin=True`` (in the class statement) for
+            mixins that extend this one, to exempt their attributes
+            from authorization (like this class's own).
+        """
+        if mixin:
+            cls._EXEMPTED = cls._EXEMPTED | frozenset(cls.__dict__.keys())
+
+        super().__init_subclass__(**kwargs)
+        cls.invalidate_perm_cache()
+
+    @classmethod
+    def invalidate_perm_cache(cls):
+        """Expands ``cls.__permissions__`` (unless that's already been
+        done), rebuilds the lookup tables derived from it, and forgets
+        :attr:`_authorizable_fields_cache`.
+
+        These are computed once per class (in :meth:`__init_subclass__`),
+        so call this if you change ``__permissions__`` (or add attributes
+        to the class) at runtime.
+
+        >>> sorted(BaseUser._perm_table[("public", "read")])
+        ['id', 'username']
+        >>> sorted(BaseUser._wildcard_roles_for_action["read"])
+        ['admin', 'self']
+        >>> sorted(BaseUser._public_perms["read"])
+        ['id', 'username']
+        >>> BaseUser._compiled is BaseUser.__permissions__
+        True
+        """
+        if cls.__permissions__ is not None and cls.__permissions__ is not cls._compiled:
+            # ``load_permissions`` leaves expanded roles as they are, so this
+            # accepts both its arguments and its output.
+            cls.__permissions__ = cls.load_permissions(**cls.__permissions__)
+            cls._compiled = cls.__permissions__
+
+        (
+            cls._perm_table, cls._wildcard_roles_for_action, cls._public_perms, cls._actions
+        ) = _build_perm_table(cls.__permissions__, cls.PUBLIC_ROLE)
+        cls._authorizable_fields_frozen = None
+
+    # noinspection PyMethodParameters
+    @classproperty
+    def _authorizable_fields_cache(cls) -> frozenset:
+        """The attributes of ``cls`` that require authorization.
+
+        Computed on first use (rather than in ``__init_subclass__``),
+        so that it includes attributes SQLAlchemy adds after the class
+        body has run.
+        """
+        fields = cls.__dict__.get("_authorizable_fields_frozen")
+
+        if fields is None:
+            exempted = cls._EXEMPTED
+            fields = frozenset(
+                key for key in dir(cls)
+                if not is_dunder(key) and key not in exempted
+            )
+            cls._authorizable_fields_frozen = fields
+
+        return fields
+
     @classmethod
     def load_permissions(cls, *, actions=None, **kwargs):
         r"""Convenience method for creating a ``__permissions__``
         dict. (You can also just pass a completed dictionary directly.)
 
+        Identical declarations are only expanded once, but each call
+        returns a fresh dictionary.
+
         Final permissions dictionary is of the shape::
 
              {"<role>": {"<action>": ["field_1", "field_2"], ...}}
@@ -142,6 +271,41 @@ class BasePermissionsMixin:
                   'read': ['*'],
                   'update': ['username', 'fullname']}}
 
+        Public fields are merged into each action of a rule separately:
+
+        >>> pprint(BasePermissionsMixin.load_permissions(
+        ...     read=["id"],
+        ...     update=["bio"],
+        ...     self=[(["read", "update"], ["username", "id"])],
+        ... ))
+        {'public': {'read': ['id'], 'update': ['bio']},
+         'self': {'read': ['username', 'id'], 'update': ['username', 'id', 'bio']}}
+
+        Actions from already-expanded roles count towards wildcards too, and
+        sets work wherever lists do:
+
+        >>> pprint(BasePermissionsMixin.load_permissions(
+        ...     friend={"read": {"username"}, "poke": ["id"]},
+        ...     self=[({"update"}, ["username"])],
+        ...     admin="*",
+        ... ))
+        {'admin': {'create': ['*'],
+                   'delete': ['*'],
+                   'poke': ['*'],
+                   'read': ['*'],
+                   'update': ['*']},
+         'friend': {'poke': ['id'], 'read': ['username']},
+         'self': {'update': ['username']}}
+
+        Rules are either an action or an ``(actions, fields)`` tuple, with
+        fields in a list (or set):
+
+        >>> BasePermissionsMixin.load_permissions(self=[["read", "delete"]])
+        Traceback (most recent call last):
+        AssertionError: Invalid permission shorthand.
+        >>> BasePermissionsMixin.load_permissions(self=[("read", "id")])
+        Traceback (most recent call last):
+        AssertionError: Invalid permission shorthand.
 
         :param actions: a list of actions to include (needed to
             expand wildcards like ``admin="*"``.)
@@ -172,76 +336,108 @@ class BasePermissionsMixin:
 
         :return:
         """
-        permissions = {}
-
-        for action_name in cls.DEFAULT_ACTIONS:
-            action = kwargs.pop(action_name, None)
-            if type(action) is list:
-                permissions["public"] = {action_name: action}
-
-        # Get a list of all available actions
-        # Do this before reading permissions in order to expand wildcards.
-        if type(actions) is not list:
-            actions = set(cls.DEFAULT_ACTIONS)
-
-            for (role, permission) in kwargs.items():
-                if type(permission) is str:  # "*"
-                    continue
-
-                for rule in permission:
-                    if type(rule) is str:
-                        # "<action>"
-                        actions.add(rule)
+        # Check the rules here: :func:`freeze` turns lists into tuples, so
+        # ``_compile_permissions`` can't tell ``[...]`` from ``(actions, fields)``.
+        for (role, permission) in kwargs.items():
+            if role in cls.DEFAULT_ACTIONS or isinstance(permission, (str, dict)):
+                continue
 
-                    elif type(rule) is tuple:
-                        # (("<action>" | ["<action_1>", ...]), ["<field_1>", ...])
-                        rule_actions, _ = rule
+            for rule in permission:
+                assert isinstance(rule, str) or (
+                    type(rule) is tuple
+                    and len(rule) == 2
+                    and isinstance(rule[0], (str, list, tuple, set, frozenset))
+                    and isinstance(rule[1], (list, tuple, set, frozenset))
+                ), "Invalid permission shorthand."
+
+        compiled = cls._compile_permissions(
+            tuple(cls.DEFAULT_ACTIONS),
+            freeze(actions),
+            tuple((role, freeze(permission)) for (role, permission) in kwargs.items())
+        )
 
-                        if type(rule_actions) is str:
-                            # ("<action>", ["<field_1>", ...])
-                            rule_actions = [rule_actions]
+        return {
+            role: {action: list(fields) for (action, fields) in permission.items()}
+            for (role, permission) in compiled.items()
+        }
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _compile_permissions(default_actions, actions, declarations):
+        """Does the actual work for :meth:`load_permissions` on
+        :func:`freeze`-ed arguments (so repeated declarations are
+        only expanded once, even across classes).
+
+        :param default_actions: A tuple of ``DEFAULT_ACTIONS``.
+        :param actions: ``None`` or a tuple of actions.
+        :param declarations: ``(role, permission)`` pairs, where
+            lists became tuples and dicts became frozensets of items.
+        :return: The permissions dictionary (with tuples of fields).
+        """
+        permissions = {}
+        declarations = dict(declarations)
 
-                        # (["<action_1>", ...], ["<field_1>", ...])
-                        actions |= set(rule_actions)
+        for action_name in default_actions:
+            action = declarations.pop(action_name, None)
+            if isinstance(action, tuple):
+                permissions.setdefault("public", {})[action_name] = list(action)
 
-            actions = list(actions)
+        # Collect all available actions while expanding, and fill in
+        # wildcards (which need all of them) at the end.
+        found_actions = set(default_actions)
+        wildcard_roles = []
 
-        for (role, permission) in kwargs.items():
+        for (role, permission) in declarations.items():
             permissions[role] = {}
 
-            if type(permission) is dict:
+            if isinstance(permission, frozenset):
                 # Skip expansion & leave as is.
                 # (``"friend": {"read": ["id", "username", "fullname"]}"``)
-                permissions[role] = permission
+                permissions[role] = {action: list(fields) for (action, fields) in permission}
+                found_actions.update(permissions[role])
             elif permission == "*":
                 # Allow all actions. (``{"admin": "*"}``)
-                permissions[role] = {action: ["*"] for action in actions}
+                wildcard_roles.append(role)
             else:
                 # Expand list rule into dict.
                 for rule in permission:
-                    if type(rule) is str:
+                    if isinstance(rule, str):
                         # Allow this action on all fields.
                         # (``"self": ["read"]``)
                         permissions[role][rule] = ["*"]
+                        found_actions.add(rule)
                     else:
-                        assert (
-                            type(rule) is tuple and len(rule) == 2
-                        ), "Invalid permission shorthand."
-
+                        # (The shape is checked in :meth:`load_permissions`.)
                         role_actions, fields = rule
+                        fields = list(fields)
+
+                        if isinstance(role_actions, str):
+                            role_actions = (role_actions,)
 
-                        if type(role_actions) is str:
-                            role_actions = [role_actions]
+                        found_actions.update(role_actions)
 
                         # Our ``actions, fields`` tuple now has a form like:
                         # ``(["create", "update"], ["username", "fullname"])``
                         for action in role_actions:
                             # Copy over default read permissions from public (if there are any)
-                            fields += permissions.get("public", {}).get(action, [])
+                            # Build a new list per action (the actions of a rule
+                            # share ``fields``) & drop duplicates, keeping order.
+                            public = permissions.get("public", {}).get(action, [])
+
+                            permissions[role][action] = list(dict.fromkeys(fields + public))
 
-                            permissions[role][action] = fields
+        if not isinstance(actions, tuple):
+            actions = found_actions
 
-        return permissions
+        for role in wildcard_roles:
+            permissions[role] = {action: ["*"] for action in actions}
+
+        # Nobody outside gets a reference to this (it's cached), but freeze
+        # the field lists anyway.
+        return {
+            role: {action: tuple(fields) for (action, fields) in permission.items()}
+            for (role, permission) in permissions.items()
+        }
 
     @property
     def permissions(self) -> dict:
@@ -252,30 +448,19 @@ class BasePermissionsMixin:
     def permissions(self, value: dict) -> dict:
         """Setter for permissions dictionary proxy."""
         self.__permissions__ = self.load_permissions(**value)
+        (
+            self._perm_table, self._wildcard_roles_for_action, self._public_perms, self.actions
+        ) = _build_perm_table(self.__permissions__, self.PUBLIC_ROLE)
+        self._authz_cache.clear()
 
     @property
-    def exempted_fields(self):
-        return (
-            list(BasePermissionsMixin.__dict__.keys()) +
-            [
-                # Attributes that are set in ``__init__``.
-                "_protected",
-                "_allowed_fields",
-                "_forbidden_fields",
-                # SQL Alchemy generics.
-                "_sa_instance_state",
-                "_sa_class_manager",
-                "_sa_registry",
-                "_decl_class_registry",
-                "permissions",
-                "metadata",
-                "registry"
-                # You'll have to use another solution (like ``oso``)
-                # if you want row-level authorization in queries.
-                "query",
-                "query_class",
-            ]
-        )
+    def exempted_fields(self) -> frozenset:
+        """The attributes that never require authorization.
+
+        .. NOTE:: This is computed once per mixin (see
+            :meth:`__init_subclass__`), not per access.
+        """
+        return type(self)._EXEMPTED
 
     # noinspection PyMethodParameters
     @classproperty
@@ -285,25 +470,36 @@ class BasePermissionsMixin:
 
     # noinspection PyMethodParameters
     @classproperty
-    def actions(cls) -> List[str]:
-        """The actions that are included in ``self.__permissions__``."""
-        return list(
-            set(
-                [
-                    action
-                    for permission in cls.__permissions__.values()
-                    for action in permission.keys()
-                ]
-            )
-        )
+    def actions(cls) -> frozenset:
+        """The actions that are included in ``self.__permissions__``.
+
+        .. NOTE:: This is computed once per class
+            (see :meth:`invalidate_perm_cache`).
+        """
+        return cls._actions
 
     @property
     def always_allowed_fields(self) -> List[str]:
         """Attributes that do not require authorization.
 
-        This is the opposite of :meth:``authorizable_fields``.
+        This is the opposite of :meth:``authorizable_fields`` (leaving out
+        dunders, which never require authorization).
+
+        >>> user = BaseUser(id="123")
+        >>> "authorize" in user.always_allowed_fields
+        True
+        >>> "username" in user.always_allowed_fields
+        False
+        >>> with user.exposed():
+        ...     "username" in user.always_allowed_fields
+        True
         """
-        return [key for key in dir(self) if not self.requires_authorization(key)]
+        cls = type(self)
+
+        if not self._protected:
+            return sorted(cls._EXEMPTED | cls._authorizable_fields_cache)
+
+        return sorted(cls._EXEMPTED)
 
     @property
     def authorizable_fields(self) -> List[str]:
@@ -314,36 +510,73 @@ class BasePermissionsMixin:
         For attributes that have been check for authorization,
         see :meth:`authorized_fields` or :meth:`authorized_fields_for`.
         """
-        return [key for key in dir(self) if self.requires_authorization(key)]
+        if not self._protected:
+            return []
+
+        return sorted(type(self)._authorizable_fields_cache)
 
-    def authorized_fields_for(self, role: str, action: str) -> List[str]:
+    def authorized_fields_for(self, role: str, action: str) -> frozenset:
         """The fields that an actor with ``role`` is allowed to perform
         ``action`` on.
 
         This is a subset of ``authorizable_fields`` and won't include
         fields that are in ``always_allowed_fields``.
+
+        .. NOTE:: This is a lookup in the ``(role, action)`` table that
+            is compiled from ``permissions``, so the result is a
+            ``frozenset`` that may contain the wildcard ``"*"``.
         """
-        fields = self.permissions.get(role, {}).get(action, [])
-        return fields
+        return self._perm_table.get((role, action), _EMPTY)
 
-    def authorized_fields(self, action):
+    def permitted_fields(self, action: str) -> frozenset:
+        """The fields that :meth:`authorize_field` allows ``action`` on
+        (for the current user), ignoring :meth:`allow`/:meth:`deny`.
+
+        This only looks at the ``PUBLIC_ROLE``, like
+        :meth:`authorize_field`. If you override one, override the other.
+
+        :returns: A set of fields, which may contain the wildcard ``"*"``.
+        """
+        return self.authorized_fields_for(self.PUBLIC_ROLE, action)
+
+    def authorized_fields(self, action: str) -> List[str]:
         """Returns all the ``authorizable_fields`` that the
-        current user is allowed to perform ``action`` on."""
+        current user is allowed to perform ``action`` on.
+
+        >>> user = BaseUser(id="123")
+        >>> user.authorized_fields(CRUD.READ.value)
+        ['id', 'username']
+        >>> with user.allowed(CRUD.READ.value, "fullname"):
+        ...     user.authorized_fields(CRUD.READ.value)
+        ['fullname', 'id', 'username']
+        >>> with user.denied(CRUD.READ.value, "username"):
+        ...     user.authorized_fields(CRUD.READ.value)
+        ['id']
+
+        .. NOTE:: This combines :meth:`permitted_fields` with
+            :meth:`allow`/:meth:`deny` (rather than trying
+            :meth:`authorize` on every field).
+        """
+        if not self._protected:
+            return []
 
-        fields = []
+        fields = type(self)._authorizable_fields_cache
 
-        for field in self.authorizable_fields:
-            # noinspection PyBroadException
-            try:
-                self.authorize(action, field)
-            except:
-                # The exceptions will vary depending on how you implement
-                # :meth:`authorize_field`.
-                continue
+        with self.exposed():
+            permitted = self.permitted_fields(action)
+
+        allowed_fields, forbidden_fields = self._allowed_fields, self._forbidden_fields
 
-            fields.append(field)
+        if "*" not in permitted:
+            if allowed_fields is not None:
+                permitted = permitted | allowed_fields.get(action, _EMPTY)
 
-        return field
+            fields = fields & permitted
+
+        if forbidden_fields is not None:
+            fields = fields - forbidden_fields.get(action, _EMPTY)
+
+        return sorted(fields)
 
     def requires_authorization(self, key):
         """Checks whether an attribute ``key`` should be authorized.
@@ -355,6 +588,15 @@ class BasePermissionsMixin:
         - Dunder methods/attributes (i.e., ``__some_method__``).
         - SQLAlchemy generics (``_sa_class_manager``, ``_sa_instance_manager``).
 
+        Attributes that are set on the instance only still require
+        authorization:
+
+        >>> user = BaseUser(id="3")
+        >>> user.secret = 5
+        >>> user.secret
+        Traceback (most recent call last):
+        PermissionError: ...
+
         .. DANGER::
           You can still expose sensitive information through these
           unauthorized fields! This project bears no liability if
@@ -362,10 +604,9 @@ class BasePermissionsMixin:
 
         """
         return (
-            not is_dunder(key)  # E.g.: "__dict__"
-            and key != "exempted_fields"
-            and key not in self.exempted_fields
-            and self._protected
+            self._protected
+            and key not in type(self)._EXEMPTED
+            and not (key.startswith("__") and key.endswith("__"))
         )
 
     def protect(self):
@@ -420,6 +661,14 @@ class BasePermissionsMixin:
     def exposed(self):
         """Turns off authentication during the current context.
 
+        The instance keeps its class (so ``type(user)`` still works with
+        SQLAlchemy, graphene, etc.):
+
+        >>> user = BaseUser(id="123")
+        >>> with user.exposed():
+        ...     type(user) is BaseUser, user.id
+        (True, '123')
+
         .. NOTE::
            When possible, consider more granularly relaxing permissions
            via :meth:`allowed` to relax particular actions on
@@ -452,15 +701,21 @@ class BasePermissionsMixin:
         """
         if field is None:
             field = self.authorizable_fields
-        elif type(field) is str:
+        elif isinstance(field, str):
             field = [field]
 
-        if type(action) is not list:
+        if isinstance(action, str):
             action = [action]
+        else:
+            action = list(action)
+
+        if self._allowed_fields is None:
+            self._allowed_fields = {}
 
         for a in action:
-            self._allowed_fields[a] = field
+            self._allowed_fields[a] = set(field)
 
+        self._authz_cache.clear()
         return action
 
     def deny(
@@ -478,15 +733,21 @@ class BasePermissionsMixin:
         if field is None:
             # Allow action on all fields
             field = self.authorizable_fields
-        elif type(field) is str:
+        elif isinstance(field, str):
             field = [field]
 
-        if type(action) is not list:
+        if isinstance(action, str):
             action = [action]
+        else:
+            action = list(action)
+
+        if self._forbidden_fields is None:
+            self._forbidden_fields = {}
 
         for a in action:
-            self._forbidden_fields[a] = field
+            self._forbidden_fields[a] = set(field)
 
+        self._authz_cache.clear()
         return action
 
     @contextmanager
@@ -529,7 +790,9 @@ class BasePermissionsMixin:
             yield
         finally:
             for a in actions:
-                self._allowed_fields[a] = []
+                self._allowed_fields[a] = set()
+
+            self._authz_cache.clear()
 
     @contextmanager
     def denied(
@@ -558,7 +821,9 @@ class BasePermissionsMixin:
             yield
         finally:
             for a in actions:
-                self._forbidden_fields[a] = []
+                self._forbidden_fields[a] = set()
+
+            self._authz_cache.clear()
 
     # noinspection PyMethodMayBeStatic
     def error(self, action: str):
@@ -594,68 +859,191 @@ class BasePermissionsMixin:
             :exec:`oso.ForbiddenError`) if not allowed.
         """
 
-        if key in self.authorized_fields_for("public", action):
+        # (Two hash lookups: a public "*" grant, or the field itself.)
+        if (
+            self.PUBLIC_ROLE in self._wildcard_roles_for_action.get(action, _EMPTY)
+            or key in self._perm_table.get((self.PUBLIC_ROLE, action), _EMPTY)
+        ):
             return
 
         raise self.error(action)
 
-    def authorize(self, action, key):
-        """Check whether the current user is allowed to perform
-        ``action`` on ``self.model.<key>``.
+    def authorize_fields_batch(self, action: str, keys: List[str]):
+        """Like :meth:`authorize_field`, but for several keys at once.
 
-        First checks for exceptions to normal ``oso`` rules due
-        to :meth:`allow` or :meth:`deny`, otherwise passes
-        the authorization request on to ``oso``.
+        By default, this just calls :meth:`authorize_field` on each
+        key. Override it if your solution can check all the keys in
+        one go (like :class:`OsoPermissionsMixin`).
 
+        :param action: One of CRUD or a custom action.
+        :param keys: The attributes/fields to authorize.
+        :returns: ``None`` if the action is allowed on every key.
+        :raises: (See :meth:`authorize_field`.)
+        """
+        for key in keys:
+            self.authorize_field(action, key)
+
+    def _requires_check(self, action, key) -> bool:
+        """The part of :meth:`authorize` that comes before
+        :meth:`authorize_field`.
+
+        Only depends on whether we're protected (which is checked
+        first), :meth:`allow`/:meth:`deny`, and the fields on the
+        model, so for the fields in :attr:`_authorizable_fields_cache`
+        the outcome is memoized per ``(action, key)`` until the next
+        :meth:`allow`/:meth:`deny`. (Whatever :meth:`authorize_field`
+        decides is *not* memoized, since that depends on the current user.)
+
+        Other attributes (set on the instance only, or added to the class
+        after the cache was built) are checked each time:
+
+        >>> user = BaseUser(id="3")
+        >>> with user.exposed():
+        ...     user.secret = 5
+        >>> with user.allowed(CRUD.READ.value, "secret"), user.denied(CRUD.READ.value, "secret"):
+        ...     user.secret
+        Traceback (most recent call last):
+        PermissionError: ...
+
+        :returns: Whether ``key`` still has to be passed on to
+            :meth:`authorize_field`.
+        :raises: If :meth:`deny` forbids ``action`` on ``key``.
         """
         if key == "requires_authorization" or not self.requires_authorization(key):
-            return
+            return False
 
-        if key in self._forbidden_fields.get(action, []):
-            if action == "read":
-                raise self.error("read")
+        cache = self._authz_cache
+
+        try:
+            return cache[(action, key)]
+        except KeyError:
+            pass
+
+        forbidden_fields = self._forbidden_fields
+
+        if forbidden_fields is not None and key in forbidden_fields.get(action, _EMPTY):
+            if action == READ:
+                raise self.error(READ)
 
             # If we're not even allowed to read the currently model,
             # throw a not found error, otherwise fallback to a
             # forbidden error.
-            self.authorize("read", key)
+            self.authorize(READ, key)
             raise self.error(action)
 
-        elif key in self.authorizable_fields and key not in self._allowed_fields.get(
-            action, []
-        ):
+        allowed_fields = self._allowed_fields
+        result = allowed_fields is None or key not in allowed_fields.get(action, _EMPTY)
+        cls = type(self)
+
+        if key in cls._authorizable_fields_cache:
+            cache[(action, key)] = result
+            return result
+
+        # (Not memoized: instance attributes come and go.)
+        return result and (
+            key in object.__getattribute__(self, "__dict__")
+            or any(key in klass.__dict__ for klass in cls.__mro__)
+        )
+
+    def authorize(self, action, key):
+        """Check whether the current user is allowed to perform
+        ``action`` on ``self.model.<key>``.
+
+        First checks for exceptions to normal ``oso`` rules due
+        to :meth:`allow` or :meth:`deny`, otherwise passes
+        the authorization request on to ``oso``.
+
+        """
+        # (Through ``type(self)`` so that this lookup isn't authorized itself.)
+        if type(self)._requires_check(self, action, key):
             # Required to avoid sending oso into a self-referential death spiral.
-            with self.exposed():
+            # (Toggled directly, rather than with :meth:`exposed`, since
+            # this is the hot path.)
+            object.__setattr__(self, "_protected", False)
+
+            try:
                 self.authorize_field(action, key)
+            finally:
+                object.__setattr__(self, "_protected", True)
 
-            return None
+        return None
+
+    def authorize_batch(self, action, keys):
+        """Like :meth:`authorize`, but for several keys at once.
+
+        Whatever isn't settled by :meth:`allow` or :meth:`deny` is
+        passed on in a single call to :meth:`authorize_fields_batch`.
+        """
+        keys = [key for key in keys if type(self)._requires_check(self, action, key)]
+
+        if keys:
+            # (See :meth:`authorize`.)
+            object.__setattr__(self, "_protected", False)
+
+            try:
+                self.authorize_fields_batch(action, keys)
+            finally:
+                object.__setattr__(self, "_protected", True)
+
+        return None
 
     def __setattr__(self, key, value):
         """Checks whether the current user is allowed to
         set the current attribute before setting."""
-        self.authorize(CRUD.UPDATE, key)
+        try:
+            protected = object.__getattribute__(self, "_protected")
+        except AttributeError:
+            # Not initialized yet (e.g. SQLAlchemy loads rows without ``__init__``).
+            protected = False
+
+        # (See :meth:`__getattribute__`. SQLAlchemy sets its ``_sa_`` attributes
+        # many times per flush.)
+        if (
+            protected
+            and key not in type(self)._EXEMPTED
+            and not key.startswith("_sa_")
+            and not (key.startswith("__") and key.endswith("__"))
+        ):
+            self.authorize(UPDATE, key)
+
         return super().__setattr__(key, value)
 
     def __getattr__(self, item):
         # Pre-initialized, these fields haven't yet been defined
         if item in ["_allowed_fields", "_forbidden_fields"]:
+            return None
+        elif item == "_authz_cache":
             return {}
         elif item == "_protected":
             return False
-        elif item == "__name__":
-            return type(self).__name__
-        elif item in dir(self):
-            # TODO: Don't know why we sometimes end up here.
-            self.authorize(CRUD.READ, item)
-            return self.__dict__[item]
 
-        raise AttributeError(f"'{self.__name__}' has no attribute '{item}'")
+        # (Not ``self.__name__``, which would come back through here.)
+        name = type(self).__name__
+
+        if item == "__name__":
+            return name
+
+        raise AttributeError(f"'{name}' has no attribute '{item}'")
 
     def __getattribute__(self, item):
         """Checks with authorizer whether the current user is allowed
         to read the current attribute before returning the value."""
-        if item != "authorize":
-            self.authorize(CRUD.READ, item)
+        try:
+            protected = object.__getattribute__(self, "_protected")
+        except AttributeError:
+            # Not initialized yet (e.g. SQLAlchemy loads rows without ``__init__``).
+            protected = False
+
+        # Unprotected instances, exempted fields (including ``authorize``),
+        # SQLAlchemy's bookkeeping, and dunders never require authorization,
+        # so skip the call to ``authorize`` (this runs on every attribute read).
+        if (
+            protected
+            and item not in type(self)._EXEMPTED
+            and not item.startswith("_sa_")
+            and not (item.startswith("__") and item.endswith("__"))
+        ):
+            self.authorize(READ, item)
 
         return object.__getattribute__(self, item)
 
@@ -669,8 +1057,40 @@ class BasePermissionsMixin:
            more interested in protecting rows from being deleted than
            pseudocolumns in the ORM super().
         """
-
-        self.authorize(CRUD.DELETE, item)
+        try:
+            protected = object.__getattribute__(self, "_protected")
+        except AttributeError:
+            protected = False
+
+        if (
+            protected
+            and item not in type(self)._EXEMPTED
+            and not item.startswith("_sa_")
+            and not (item.startswith("__") and item.endswith("__"))
+        ):
+            self.authorize(DELETE, item)
 
         super().__delattr__(item)
 
+
+BasePermissionsMixin._EXEMPTED = frozenset(BasePermissionsMixin.__dict__.keys()) | frozenset(
+    [
+        # Attributes that are set in ``__init__``.
+        "_protected",
+        "_allowed_fields",
+        "_forbidden_fields",
+        "_authz_cache",
+        # SQL Alchemy generics.
+        "_sa_instance_state",
+        "_sa_class_manager",
+        "_sa_registry",
+        "_decl_class_registry",
+        "permissions",
+        "metadata",
+        "registry",
+        # You'll have to use another solution (like ``oso``)
+        # if you want row-level authorization in queries.
+        "query",
+        "query_class",
+    ]
+)
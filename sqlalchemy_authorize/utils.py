@@ -18,8 +18,37 @@ def is_dunder(name: str) -> bool:
     True
     >>> is_dunder("_some_not_dunder")
     False
+    >>> is_dunder("__x__")
+    True
+    >>> is_dunder("____")
+    False
 
     :param name:
     :return:
     """
-    return len(name) > 5 and (name[:2] == name[-2:] == "__")
+    return name.startswith("__") and name.endswith("__") and len(name) > 4
+
+
+def freeze(value):
+    """Hashable copy of a (nested) structure of lists, tuples and dicts.
+
+    Lists and tuples become tuples; dicts become frozensets of their
+    items; sets become sorted tuples (so that they can't be confused
+    with dicts). Everything else is left as is.
+
+    >>> freeze({"self": ["read", (["create", "update"], ["username"])]})
+    frozenset({('self', ('read', (('create', 'update'), ('username',))))})
+    >>> freeze({"b", "a"})
+    ('a', 'b')
+
+    :param value:
+    :return:
+    """
+    if isinstance(value, dict):
+        return frozenset((k, freeze(v)) for (k, v) in value.items())
+    elif isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    elif isinstance(value, (set, frozenset)):
+        return tuple(sorted((freeze(v) for v in value), key=repr))
+
+    return value
@@ -5,4 +5,20 @@ from flask import appcontext_pushed, g
 from oso import Oso
 from sqlalchemy_oso import register_models
 
+from conftest import User, load_oso
+from sqlalchemy_authorize import OsoPermissionsMixin
 
+# A policy whose ``allow_field`` can't be queried with an unbound ``field``.
+FULL_FIELDS_POLICY = """
+allow_field(user: User, "read", resource: User, field) if
+    user.id = resource.id and field.startswith("full");
+"""
+
+
+def test_authorized_fields_checks_each_field(monkeypatch):
+    user = User(id="1", username="jdoe", fullname="John Doe")
+    oso = load_oso(FULL_FIELDS_POLICY)
+    monkeypatch.setattr(OsoPermissionsMixin, "oso_resolver", lambda: oso)
+    monkeypatch.setattr(OsoPermissionsMixin, "user_resolver", lambda: user)
+
+    assert user.authorized_fields("read") == ["fullname", "id", "username"]
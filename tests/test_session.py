@@ -0,0 +1,21 @@
+"""Tests for the ``session`` fixture in ``conftest.py``.
+
+These run in order: the second checks that nothing the first did
+(including a commit after a rollback) outlives it.
+"""
+from conftest import BaseUser
+
+
+def test_session_commit_and_rollback(session):
+    session.add(BaseUser(id="rolled_back", username="a", fullname="A", protected=False))
+    session.flush()
+    session.rollback()
+    assert session.get(BaseUser, "rolled_back") is None
+
+    session.add(BaseUser(id="committed", username="b", fullname="B", protected=False))
+    session.commit()
+    assert session.get(BaseUser, "committed") is not None
+
+
+def test_session_is_isolated(session):
+    assert session.query(BaseUser).count() == 0